@@ -5,108 +5,255 @@ Loads configuration from config.yaml with sensible defaults.
 Supports environment variable overrides for sensitive values.
 """
 
+import hashlib
+import json
 import os
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Annotated, List, Mapping, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import ConfigDict, Field, TypeAdapter
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Config models are plain slotted dataclasses: pydantic validates them once at
+# load time (via TypeAdapter), after which they are read-only value objects.
+
+
+# Shared read-only headers for services without a Host override
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
+class ServiceConfig:
+    """
+    Configuration for a monitored service.
+
+    check_url, headers and display_url are derived once at load time so the
+    health check loop doesn't rebuild them on every poll.
+    """
+    __pydantic_config__ = ConfigDict(populate_by_name=True)
 
-class ServiceConfig(BaseModel):
-    """Configuration for a monitored service."""
     name: str
     url: str
     host: Optional[str] = None  # Optional Host header for Traefik routing
-    health_path: Optional[str] = Field(default=None, alias="healthPath")
+    health_path: Annotated[Optional[str], Field(alias="healthPath")] = None
+
+    check_url: str = field(init=False, repr=False, compare=False)
+    headers: Mapping[str, str] = field(init=False, repr=False, compare=False)
+    display_url: str = field(init=False, repr=False, compare=False)
 
-    class Config:
-        populate_by_name = True
+    def __post_init__(self):
+        # Frozen dataclass, so derived fields are set via object.__setattr__
+        check_url = self.url.rstrip("/") + self.health_path if self.health_path else self.url
+        object.__setattr__(self, "check_url", check_url)
+        object.__setattr__(self, "headers", MappingProxyType({"Host": self.host}) if self.host else _EMPTY_HEADERS)
+        object.__setattr__(self, "display_url", f"http://{self.host}" if self.host else self.url)
 
 
-class NodeConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class NodeConfig:
     """Configuration for a Prometheus node exporter target."""
     name: str
     host: str  # IP:port format, e.g., "192.168.1.10:9100"
 
 
-class PrometheusConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PrometheusConfig:
     """Prometheus integration configuration."""
     enabled: bool = False
     url: str = "http://prometheus:9090"
-    nodes: List[NodeConfig] = []
+    nodes: List[NodeConfig] = field(default_factory=list)
 
 
-class KubernetesConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class KubernetesConfig:
     """Kubernetes integration configuration."""
     enabled: bool = False
     kubeconfig: Optional[str] = None  # Path to kubeconfig, None = in-cluster
 
 
-class FirewallConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class FirewallConfig:
     """Firewall integration configuration."""
+    __pydantic_config__ = ConfigDict(populate_by_name=True)
+
     enabled: bool = False
     type: str = "none"  # fortigate | pfsense | opnsense | none
     host: str = ""
-    token_env_var: str = Field(default="FORTIGATE_TOKEN", alias="tokenEnvVar")
-    verify_ssl: bool = Field(default=False, alias="verifySsl")
-
-    class Config:
-        populate_by_name = True
+    token_env_var: Annotated[str, Field(alias="tokenEnvVar")] = "FORTIGATE_TOKEN"
+    verify_ssl: Annotated[bool, Field(alias="verifySsl")] = False
 
 
-class DashboardConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DashboardConfig:
     """Dashboard display configuration."""
+    __pydantic_config__ = ConfigDict(populate_by_name=True)
+
     title: str = "CITADEL MONITOR"
     version: str = "v1.0.0"
     tagline: Optional[str] = None
+    # Allowed CORS origins; empty allows any origin ("*")
+    cors_origins: Annotated[List[str], Field(alias="corsOrigins")] = field(default_factory=list)
 
 
-class Config(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Config:
     """Root configuration model."""
-    dashboard: DashboardConfig = Field(default_factory=DashboardConfig)
-    services: List[ServiceConfig] = []
-    prometheus: PrometheusConfig = Field(default_factory=PrometheusConfig)
-    kubernetes: KubernetesConfig = Field(default_factory=KubernetesConfig)
-    firewall: FirewallConfig = Field(default_factory=FirewallConfig)
+    dashboard: DashboardConfig = field(default_factory=DashboardConfig)
+    services: List[ServiceConfig] = field(default_factory=list)
+    prometheus: PrometheusConfig = field(default_factory=PrometheusConfig)
+    kubernetes: KubernetesConfig = field(default_factory=KubernetesConfig)
+    firewall: FirewallConfig = field(default_factory=FirewallConfig)
 
 
-def load_config() -> Config:
+_CONFIG_ADAPTER = TypeAdapter(Config)
+
+
+def _schema_fingerprint() -> str:
+    """
+    Hash the config field names, types and defaults.
+
+    Stored in the JSON sidecar so a sidecar written by a build with a
+    different config schema is never trusted.
+    """
+    parts = []
+    for cls in (ServiceConfig, NodeConfig, PrometheusConfig, KubernetesConfig,
+                FirewallConfig, DashboardConfig, Config):
+        for f in fields(cls):
+            if f.default is not MISSING:
+                default = repr(f.default)
+            elif f.default_factory is not MISSING:
+                default = f.default_factory.__name__
+            else:
+                default = ""
+            parts.append(f"{cls.__name__}.{f.name}:{f.type}={default}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+_SCHEMA_FINGERPRINT = _schema_fingerprint()
+
+
+def _construct_config(data: dict) -> Config:
+    """Build a Config from trusted, already-validated data without re-validating."""
+    prometheus = dict(data["prometheus"])
+    prometheus["nodes"] = [NodeConfig(**n) for n in prometheus["nodes"]]
+    return Config(
+        dashboard=DashboardConfig(**data["dashboard"]),
+        services=[ServiceConfig(**s) for s in data["services"]],
+        prometheus=PrometheusConfig(**prometheus),
+        kubernetes=KubernetesConfig(**data["kubernetes"]),
+        firewall=FirewallConfig(**data["firewall"]),
+    )
+
+
+def _read_config(path: Path) -> Config:
     """
-    Load configuration from config.yaml.
+    Read and validate configuration from a YAML file.
+
+    The validated config is cached in a JSON sidecar (config.yaml.json) next
+    to the YAML file. While the sidecar is at least as new as the YAML source
+    and was written for the current config schema, it is trusted and loaded
+    without running validation again.
+    """
+    cache = path.with_suffix(path.suffix + ".json")
+    try:
+        if cache.stat().st_mtime >= path.stat().st_mtime:
+            cached = json.loads(cache.read_bytes())
+            if cached["schema"] == _SCHEMA_FINGERPRINT:
+                return _construct_config(cached["config"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    config = _CONFIG_ADAPTER.validate_python(data)
+
+    # Config mounts are often read-only (Docker/K8s), so caching is best-effort
+    try:
+        cache.write_text(json.dumps({
+            "schema": _SCHEMA_FINGERPRINT,
+            "config": _CONFIG_ADAPTER.dump_python(config, mode="json"),
+        }))
+    except OSError:
+        pass
+
+    return config
+
+
+# Existing config files found by _find_config_paths, cached per process
+_CONFIG_PATHS: Optional[List[Path]] = None
+
+
+def _find_config_paths() -> List[Path]:
+    """
+    Return the existing config file candidates, in priority order.
 
     Searches for config.yaml in:
-    1. /app/config.yaml (Docker/K8s mount point)
-    2. ./config.yaml (current directory)
-    3. ../config.yaml (parent directory, for running from backend/)
+    1. $CONFIG_FILE (if set)
+    2. /app/config.yaml (Docker/K8s mount point)
+    3. ./config.yaml (current directory)
+    4. ../config.yaml (parent directory, for running from backend/)
+
+    The filesystem is only probed on the first call; use reload_config()
+    to search again.
+    """
+    global _CONFIG_PATHS
 
+    if _CONFIG_PATHS is None:
+        config_paths = [
+            Path("/app/config.yaml"),
+            Path("./config.yaml"),
+            Path("../config.yaml"),
+        ]
+
+        # Also check CONFIG_FILE environment variable
+        env_config = os.environ.get("CONFIG_FILE")
+        if env_config:
+            config_paths.insert(0, Path(env_config))
+
+        _CONFIG_PATHS = [path for path in config_paths if path.exists()]
+
+    return _CONFIG_PATHS
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Config:
+    """
+    Load configuration from the first parseable config.yaml.
+
+    See _find_config_paths for the search order.
     Falls back to defaults if no config file found.
+    The result is memoized, so the file is only read once per process.
     """
-    config_paths = [
-        Path("/app/config.yaml"),
-        Path("./config.yaml"),
-        Path("../config.yaml"),
-    ]
-
-    # Also check CONFIG_FILE environment variable
-    env_config = os.environ.get("CONFIG_FILE")
-    if env_config:
-        config_paths.insert(0, Path(env_config))
-
-    for path in config_paths:
-        if path.exists():
-            try:
-                with open(path, "r") as f:
-                    data = yaml.safe_load(f) or {}
-                print(f"Loaded configuration from {path}")
-                return Config(**data)
-            except Exception as e:
-                print(f"Warning: Failed to parse {path}: {e}")
-                continue
+    for path in _find_config_paths():
+        try:
+            loaded = _read_config(path)
+            print(f"Loaded configuration from {path}")
+            return loaded
+        except Exception as e:
+            print(f"Warning: Failed to parse {path}: {e}")
+            continue
 
     print("Warning: No config.yaml found, using defaults")
     return Config()
 
 
-# Global config instance - loaded once at startup
-config = load_config()
+def reload_config() -> Config:
+    """Forget the cached config and config file location, then load again."""
+    global _CONFIG_PATHS
+
+    _CONFIG_PATHS = None
+    load_config.cache_clear()
+    return load_config()
+
+
+def __getattr__(name: str):
+    """Resolve the global `config` lazily on first access (PEP 562)."""
+    if name == "config":
+        return load_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
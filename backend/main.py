@@ -9,36 +9,28 @@ Configuration is loaded from config.yaml - see config.example.yaml for options.
 
 import asyncio
 import logging
+import math
+import mimetypes
 import os
+import re
+import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import aiohttp
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response
 
-from config import config
+from config import NodeConfig, ServiceConfig, load_config
 
-# Conditional imports for optional integrations
-prom = None
-if config.prometheus.enabled:
-    try:
-        from prometheus_api_client import PrometheusConnect
-    except ImportError:
-        PrometheusConnect = None  # type: ignore
-
-K8S_AVAILABLE = False
-k8s_core_v1: Optional[Any] = None
-if config.kubernetes.enabled:
-    try:
-        from kubernetes import client, config as k8s_config
-        from kubernetes.client.rest import ApiException
-        K8S_AVAILABLE = True
-    except ImportError:
-        pass
+config = load_config()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -47,17 +39,22 @@ logger = logging.getLogger(__name__)
 # Initialize Clients Based on Configuration
 # =============================================================================
 
-# Prometheus client
-if config.prometheus.enabled:
+# The Kubernetes client library is imported on first use, so a disabled
+# integration never pays its import time or memory. Prometheus needs no client
+# library: it is queried over the shared HTTP session (see prom_query).
+
+@lru_cache(maxsize=1)
+def get_k8s_core() -> Optional[Any]:
+    """Return the Kubernetes CoreV1Api client, or None if disabled or unavailable."""
+    if not config.kubernetes.enabled:
+        return None
+
     try:
-        if PrometheusConnect:
-            prom = PrometheusConnect(url=config.prometheus.url, disable_ssl=True)
-            logger.info(f"Prometheus client initialized: {config.prometheus.url}")
-    except Exception as e:
-        logger.warning(f"Failed to initialize Prometheus client: {e}")
+        from kubernetes import client, config as k8s_config
+    except ImportError:
+        logger.warning("kubernetes client is not installed")
+        return None
 
-# Kubernetes client
-if config.kubernetes.enabled and K8S_AVAILABLE:
     try:
         if config.kubernetes.kubeconfig:
             k8s_config.load_kube_config(config_file=config.kubernetes.kubeconfig)
@@ -73,9 +70,11 @@ if config.kubernetes.enabled and K8S_AVAILABLE:
         logger.warning(f"Failed to load Kubernetes config: {e}")
 
     try:
-        k8s_core_v1 = client.CoreV1Api()
+        return client.CoreV1Api()
     except Exception as e:
         logger.warning(f"Failed to initialize Kubernetes client: {e}")
+        return None
+
 
 # Get firewall API token from environment if configured
 FORTIGATE_API_KEY = ""
@@ -90,87 +89,349 @@ app = FastAPI(
     title=config.dashboard.title,
     description="Real-time infrastructure monitoring API",
     version=config.dashboard.version,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware
+# CORS middleware - restricted to dashboard.corsOrigins when configured,
+# otherwise any origin is allowed
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=frozenset(config.dashboard.cors_origins) or ["*"],
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=("GET", "POST"),
     allow_headers=["*"],
 )
 
+# =============================================================================
+# Shared HTTP Sessions
+# =============================================================================
+
+# Long-lived sessions so connections, TLS sessions and DNS lookups are pooled
+# instead of being rebuilt on every dashboard tick. HTTP_SESSION serves service
+# health checks and Prometheus queries; FIREWALL_SESSION talks to the firewall
+# API with its own SSL verification setting.
+HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+FIREWALL_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+@app.on_event("startup")
+async def open_http_sessions():
+    global HTTP_SESSION, FIREWALL_SESSION
+    HTTP_SESSION = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=200, ttl_dns_cache=300, keepalive_timeout=60, ssl=False),
+        timeout=aiohttp.ClientTimeout(total=5),
+    )
+    if config.firewall.enabled:
+        FIREWALL_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60, ssl=config.firewall.verify_ssl),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+
+
+@app.on_event("shutdown")
+async def close_http_sessions():
+    for session in (HTTP_SESSION, FIREWALL_SESSION):
+        if session:
+            await session.close()
+
+
+# =============================================================================
+# Kubernetes Watch Caches
+# =============================================================================
+
+class ResourceWatcher:
+    """
+    In-memory mirror of one Kubernetes resource type, kept current by a watch.
+
+    A daemon thread LISTs the resource (served from the API server cache), then
+    follows a watch from the returned resourceVersion, applying ADDED/MODIFIED/
+    DELETED events. When the watch times out, expires (410 Gone) or fails, it
+    lists again. Readers only ever touch memory.
+
+    `transform` reduces each object to the fields the dashboard needs, so full
+    API objects aren't kept around.
+    """
+
+    WATCH_TIMEOUT = 300  # seconds before a watch is restarted with a fresh LIST
+    RETRY_DELAY = 5  # seconds to wait after an unexpected failure
+
+    def __init__(self, name: str, list_func: Callable[..., Any], transform: Callable[[Any], Any]):
+        self.name = name
+        self.list_func = list_func
+        self.transform = transform
+        self.items: Dict[str, Any] = {}
+
+    def start(self):
+        threading.Thread(target=self._run, name=f"watch-{self.name}", daemon=True).start()
+
+    def values(self) -> List[Any]:
+        # Snapshot; the watch thread may be updating items concurrently
+        return list(self.items.values())
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _replace(self, objs: List[Any]):
+        self.items = {obj.metadata.uid: self.transform(obj) for obj in objs}
+
+    def _apply(self, event_type: str, obj: Any):
+        if event_type == "DELETED":
+            self.items.pop(obj.metadata.uid, None)
+        elif event_type in ("ADDED", "MODIFIED"):
+            self.items[obj.metadata.uid] = self.transform(obj)
+
+    def _run(self):
+        from kubernetes import watch
+        from kubernetes.client.rest import ApiException
+
+        while True:
+            try:
+                listing = self.list_func(resource_version="0")
+                self._replace(listing.items)
+                stream = watch.Watch().stream(
+                    self.list_func,
+                    resource_version=listing.metadata.resource_version,
+                    timeout_seconds=self.WATCH_TIMEOUT,
+                    _request_timeout=self.WATCH_TIMEOUT + 30,
+                )
+                for event in stream:
+                    self._apply(event["type"], event["object"])
+            except ApiException as e:
+                if e.status != 410:  # 410 Gone just means relist
+                    logger.warning("Kubernetes %s watch failed: %s", self.name, e)
+                    time.sleep(self.RETRY_DELAY)
+            except Exception as e:
+                logger.warning("Kubernetes %s watch failed: %s", self.name, e)
+                time.sleep(self.RETRY_DELAY)
+
+
+def _node_readiness(node: Any) -> Tuple[str, bool]:
+    """Reduce a V1Node to (name, ready)."""
+    for condition in node.status.conditions or []:
+        if condition.type == "Ready":
+            return node.metadata.name, condition.status == "True"
+    return node.metadata.name, False
+
+
+class EventWatcher(ResourceWatcher):
+    """
+    ResourceWatcher for Events that keeps only the most recent ones.
+
+    Instead of mirroring every event, it holds a bounded deque of event
+    summaries ordered newest first: the initial LIST is sorted by timestamp,
+    after which watch events are pushed to the front as they arrive.
+    """
+
+    def __init__(self, list_func: Callable[..., Any], maxlen: int = 20):
+        super().__init__("events", list_func, _event_summary)
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=maxlen)
+
+    def values(self) -> List[Dict[str, Any]]:
+        return list(self.recent)
+
+    def __len__(self) -> int:
+        return len(self.recent)
+
+    def _replace(self, objs: List[Any]):
+        summaries = sorted(
+            (self.transform(obj) for obj in objs),
+            key=lambda e: e["timestamp"] or datetime.min.replace(tzinfo=timezone.utc),
+            reverse=True,
+        )
+        self.recent = deque(summaries[:self.recent.maxlen], maxlen=self.recent.maxlen)
+
+    def _apply(self, event_type: str, obj: Any):
+        if event_type not in ("ADDED", "MODIFIED"):
+            return
+        summary = self.transform(obj)
+        # A MODIFIED event (e.g. a repeat count bump) replaces its older entry.
+        # The deque is rebuilt and swapped in so readers never see it mid-update.
+        recent = [summary, *(e for e in self.recent if e["uid"] != summary["uid"])]
+        self.recent = deque(recent[:self.recent.maxlen], maxlen=self.recent.maxlen)
+
+
+def _event_summary(event: Any) -> Dict[str, Any]:
+    """Reduce a CoreV1Event to the fields shown in the activity timeline."""
+    message = event.message or ""
+    if len(message) > 80:
+        message = message[:77] + "..."
+
+    source_component = ""
+    if event.source and event.source.component:
+        source_component = event.source.component
+
+    timestamp = event.last_timestamp or event.event_time
+    if timestamp and timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+
+    return {
+        "uid": event.metadata.uid,
+        "timestamp": timestamp,
+        "message": message,
+        "type": event.type or "Normal",
+        "source": source_component,
+        "namespace": event.metadata.namespace,
+        "reason": event.reason,
+    }
+
+
+# Watchers by resource ("nodes", "pods", "namespaces", "events"); empty unless enabled
+K8S_WATCHERS: Dict[str, ResourceWatcher] = {}
+
+
+@app.on_event("startup")
+async def start_k8s_watchers():
+    k8s_core_v1 = get_k8s_core()
+    if not k8s_core_v1:
+        return
+
+    K8S_WATCHERS.update({
+        "nodes": ResourceWatcher("nodes", k8s_core_v1.list_node, _node_readiness),
+        "pods": ResourceWatcher("pods", k8s_core_v1.list_pod_for_all_namespaces, lambda pod: pod.status.phase),
+        "namespaces": ResourceWatcher("namespaces", k8s_core_v1.list_namespace, lambda ns: ns.metadata.name),
+        "events": EventWatcher(k8s_core_v1.list_event_for_all_namespaces),
+    })
+    for watcher in K8S_WATCHERS.values():
+        watcher.start()
+
+
 # =============================================================================
 # WebSocket Connection Manager
 # =============================================================================
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket connected. Active connections: {len(self.active_connections)}")
+    def connect(self, websocket: WebSocket):
+        self.active_connections.add(websocket)
+        logger.info("WebSocket connected. Active connections: %d", len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Active connections: {len(self.active_connections)}")
-
-    async def broadcast(self, message: dict):
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
+        self.active_connections.discard(websocket)
+        logger.info("WebSocket disconnected. Active connections: %d", len(self.active_connections))
+
+    async def broadcast_text(self, payload: str):
+        # Send to all clients concurrently so a slow client doesn't hold up
+        # the rest
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
 
-        for conn in disconnected:
-            self.disconnect(conn)
+        disconnected = {conn for conn, result in zip(connections, results) if isinstance(result, Exception)}
+        if disconnected:
+            self.active_connections -= disconnected
+            logger.info("Dropped %d WebSocket connections. Active connections: %d", len(disconnected), len(self.active_connections))
 
 
 manager = ConnectionManager()
 
-# Storage for bandwidth rate calculation
-_previous_interface_stats: Dict[str, Dict[str, Any]] = {}
+# Storage for bandwidth rate calculation: previous byte counters kept as
+# parallel arrays, indexed by interface position in _iface_index
+_iface_index: Dict[str, int] = {}
+_prev_rx_bytes: List[int] = []
+_prev_tx_bytes: List[int] = []
 _last_interface_poll: Optional[datetime] = None
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+def ttl_cache(ttl: float):
+    """
+    Cache the result of an argument-less coroutine function for `ttl` seconds.
+
+    Concurrent callers share a single in-flight call, so several dashboard
+    clients polling within the same window cost one round trip to the backend.
+    The TTL starts when the call finishes, so a call slower than its TTL is
+    still never started twice. Failed calls are not cached. Results are
+    shared, so callers must not mutate them.
+    """
+    def decorator(func):
+        task: Optional[asyncio.Task] = None
+        expires = 0.0  # math.inf while the current call is in flight
+
+        def finished(done: asyncio.Task):
+            nonlocal task, expires
+            if done is not task:
+                return
+            if done.cancelled() or done.exception() is not None:
+                task = None
+            else:
+                expires = time.monotonic() + ttl
+
+        @wraps(func)
+        async def wrapper():
+            nonlocal task, expires
+            if task is None or expires <= time.monotonic() or task.get_loop() is not asyncio.get_running_loop():
+                expires = math.inf
+                task = asyncio.ensure_future(func())
+                task.add_done_callback(finished)
+            # Shielded so one caller being cancelled doesn't cancel the rest
+            return await asyncio.shield(task)
+
+        return wrapper
+    return decorator
+
+
+# Alert name keywords per category, checked in order (first match wins)
+ALERT_CATEGORIES = (
+    ("resources", ("cpu", "memory", "ram", "disk", "filesystem", "storage")),
+    ("kubernetes", ("pod", "container", "deployment", "replica", "kube", "kubernetes")),
+    ("infrastructure", ("node", "host", "server", "instance", "machine")),
+    ("network", ("network", "connection", "dns", "http", "tcp", "latency")),
+)
+
+# All categories compiled into one pattern. Each branch is anchored at the
+# start and lazily scans for its keywords, so branches are tried in category
+# order and the first category with any keyword wins; m.lastgroup names it.
+_ALERT_CATEGORY_RE = re.compile(
+    "|".join(
+        f"(?P<{category}>.*?(?:{'|'.join(map(re.escape, keywords))}))"
+        for category, keywords in ALERT_CATEGORIES
+    ),
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=256)
 def categorize_alert(alertname: str) -> str:
-    """Categorize alerts by keywords in name."""
-    alertname_lower = alertname.lower()
+    """
+    Categorize alerts by keywords in name.
+
+    Memoized since the same alert names come back on every poll.
+    """
+    m = _ALERT_CATEGORY_RE.match(alertname.lower())
+    return m.lastgroup if m else "general"
 
-    if any(kw in alertname_lower for kw in ["cpu", "memory", "ram", "disk", "filesystem", "storage"]):
-        return "resources"
-    elif any(kw in alertname_lower for kw in ["pod", "container", "deployment", "replica", "kube", "kubernetes"]):
-        return "kubernetes"
-    elif any(kw in alertname_lower for kw in ["node", "host", "server", "instance", "machine"]):
-        return "infrastructure"
-    elif any(kw in alertname_lower for kw in ["network", "connection", "dns", "http", "tcp", "latency"]):
-        return "network"
-    else:
-        return "general"
+
+# (seconds per unit, suffix) for format_time_ago, largest unit first
+_TIME_AGO_UNITS = ((86400, "d"), (3600, "h"), (60, "m"), (1, "s"))
 
 
 def format_time_ago(delta: timedelta) -> str:
     """Format timedelta as '5s', '5m', '2h', '1d'."""
-    total_seconds = int(delta.total_seconds())
+    total_seconds = delta.days * 86400 + delta.seconds
 
-    if total_seconds < 0:
+    if total_seconds <= 0:
         return "0s"
-    elif total_seconds < 60:
-        return f"{total_seconds}s"
-    elif total_seconds < 3600:
-        return f"{total_seconds // 60}m"
-    elif total_seconds < 86400:
-        return f"{total_seconds // 3600}h"
-    else:
-        return f"{total_seconds // 86400}d"
+    for unit_seconds, suffix in _TIME_AGO_UNITS:
+        if total_seconds >= unit_seconds:
+            return f"{total_seconds // unit_seconds}{suffix}"
+
+
+def format_time_ago_from(now: datetime, then: datetime) -> str:
+    """
+    Format the time elapsed since `then` relative to a caller-supplied `now`.
+
+    Callers formatting many timestamps should read the clock once and pass the
+    same `now` to every call. Naive datetimes are assumed to be UTC.
+    """
+    if then.tzinfo is None:
+        then = then.replace(tzinfo=timezone.utc)
+    return format_time_ago(now - then)
 
 
 def format_uptime(seconds: int) -> str:
@@ -178,16 +439,15 @@ def format_uptime(seconds: int) -> str:
     if seconds <= 0:
         return "Unknown"
 
-    days = seconds // 86400
-    hours = (seconds % 86400) // 3600
-    minutes = (seconds % 3600) // 60
+    days, rem = divmod(seconds, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes = rem // 60
 
-    if days > 0:
+    if days:
         return f"{days}d {hours}h"
-    elif hours > 0:
+    if hours:
         return f"{hours}h {minutes}m"
-    else:
-        return f"{minutes}m"
+    return f"{minutes}m"
 
 
 def parse_prometheus_time(time_str: str) -> Optional[datetime]:
@@ -204,6 +464,60 @@ def parse_prometheus_time(time_str: str) -> Optional[datetime]:
 # Data Aggregation Functions
 # =============================================================================
 
+def _node_ip(host: str) -> str:
+    """Extract the IP from a node host (format: IP:port)."""
+    return host.split(":")[0] if ":" in host else host
+
+
+# Node health thresholds (percent); at or above either one is a warning
+CPU_WARN, RAM_WARN = 80.0, 85.0
+
+# Configured nodes paired with their IPs, and the per-metric queries matching
+# every node's instance in a single regex (config is fixed for the process)
+NODE_TARGETS: Tuple[Tuple[NodeConfig, str], ...] = tuple(
+    (node_config, _node_ip(node_config.host)) for node_config in config.prometheus.nodes
+)
+_INSTANCE_RE = "|".join(f"{ip}:.*" for _, ip in NODE_TARGETS)
+# CPU usage: 100 - avg idle over 5m
+CPU_QUERY = f'100 - (avg by (instance) (rate(node_cpu_seconds_total{{mode="idle", instance=~"{_INSTANCE_RE}"}}[5m])) * 100)'
+# RAM usage: (1 - available/total) * 100
+RAM_QUERY = f'(1 - (node_memory_MemAvailable_bytes{{instance=~"{_INSTANCE_RE}"}} / node_memory_MemTotal_bytes{{instance=~"{_INSTANCE_RE}"}})) * 100'
+# Disk usage for root filesystem
+DISK_QUERY = f'(1 - (node_filesystem_avail_bytes{{instance=~"{_INSTANCE_RE}", mountpoint="/", fstype!="tmpfs"}} / node_filesystem_size_bytes{{instance=~"{_INSTANCE_RE}", mountpoint="/", fstype!="tmpfs"}})) * 100'
+
+
+PROM_QUERY_URL = f"{config.prometheus.url.rstrip('/')}/api/v1/query"
+# Server-side evaluation timeout, so Prometheus abandons a slow query instead
+# of burning CPU on it after HTTP_SESSION's 5s client timeout has given up
+PROM_QUERY_TIMEOUT = "4s"
+
+
+async def prom_query(query: str) -> List[Dict[str, Any]]:
+    """
+    Run a Prometheus instant query and return its result vector.
+
+    POSTed over the shared HTTP_SESSION so it never blocks the event loop.
+    Raises on connection errors and non-2xx responses.
+    """
+    async with HTTP_SESSION.post(PROM_QUERY_URL, data={"query": query, "timeout": PROM_QUERY_TIMEOUT}) as resp:
+        resp.raise_for_status()
+        return orjson.loads(await resp.read())["data"]["result"]
+
+
+async def _query_values_by_ip(query: str, label: str) -> Dict[str, float]:
+    """Run a Prometheus instant query and map each series' instance IP to its value."""
+    values: Dict[str, float] = {}
+    try:
+        result = await prom_query(query)
+        for item in result:
+            ip = _node_ip(item.get("metric", {}).get("instance", ""))
+            values.setdefault(ip, float(item["value"][1]))
+    except Exception as e:
+        logger.debug("%s query failed: %s", label, e)
+    return values
+
+
+@ttl_cache(4)
 async def get_node_metrics() -> List[Dict[str, Any]]:
     """
     Get metrics for configured nodes from Prometheus.
@@ -212,77 +526,45 @@ async def get_node_metrics() -> List[Dict[str, Any]]:
     - CPU usage: 100 - (avg idle CPU over 5m)
     - RAM usage: (1 - MemAvailable/MemTotal) * 100
     - Disk usage: (1 - avail/total) * 100 for root filesystem
-    - K8s node status: Ready/NotReady from K8s API (if enabled)
-    - Health: "healthy" if CPU<80, RAM<85, status=Ready, else "warning"/"error"
+      (each metric is fetched for all nodes in one query)
+    - K8s node status: Ready/NotReady from the K8s node watch cache (if enabled)
+    - Health: "healthy" if CPU<CPU_WARN, RAM<RAM_WARN, status=Ready, else "warning"/"error"
     """
-    if not config.prometheus.enabled or not config.prometheus.nodes:
+    if not config.prometheus.enabled or not NODE_TARGETS:
         return []
 
     nodes = []
 
-    # Get K8s node statuses if enabled
+    # Get K8s node statuses from the watch cache if enabled
     k8s_node_status = {}
-    if config.kubernetes.enabled and k8s_core_v1:
-        try:
-            k8s_nodes = k8s_core_v1.list_node()
-            for node in k8s_nodes.items:
-                name = node.metadata.name
-                ready = "NotReady"
-                for condition in node.status.conditions or []:
-                    if condition.type == "Ready":
-                        ready = "Ready" if condition.status == "True" else "NotReady"
-                        break
-                k8s_node_status[name] = ready
-        except Exception as e:
-            logger.warning(f"Failed to get K8s node status: {e}")
+    if K8S_WATCHERS:
+        k8s_node_status = {
+            name: "Ready" if ready else "NotReady"
+            for name, ready in K8S_WATCHERS["nodes"].values()
+        }
+
+    # Query each metric once for all nodes and run the three queries concurrently
+    cpu_by_ip, ram_by_ip, disk_by_ip = await asyncio.gather(
+        _query_values_by_ip(CPU_QUERY, "CPU"),
+        _query_values_by_ip(RAM_QUERY, "RAM"),
+        _query_values_by_ip(DISK_QUERY, "Disk"),
+    )
 
-    for node_config in config.prometheus.nodes:
+    for node_config, node_ip in NODE_TARGETS:
         node_name = node_config.name
-        node_host = node_config.host
-        # Extract IP from host (format: IP:port)
-        node_ip = node_host.split(":")[0] if ":" in node_host else node_host
 
         # Use None to indicate no data available
-        cpu_usage: Optional[float] = None
-        ram_usage: Optional[float] = None
-        disk_usage: Optional[float] = None
+        cpu = cpu_by_ip.get(node_ip)
+        ram = ram_by_ip.get(node_ip)
+        disk = disk_by_ip.get(node_ip)
         status = k8s_node_status.get(node_name, "Unknown")
 
-        if prom:
-            try:
-                # CPU usage: 100 - avg idle over 5m
-                cpu_query = f'100 - (avg by (instance) (rate(node_cpu_seconds_total{{mode="idle", instance=~"{node_ip}:.*"}}[5m])) * 100)'
-                cpu_result = prom.custom_query(cpu_query)
-                if cpu_result:
-                    cpu_usage = float(cpu_result[0]["value"][1])
-            except Exception as e:
-                logger.debug(f"CPU query failed for {node_name}: {e}")
-
-            try:
-                # RAM usage: (1 - available/total) * 100
-                ram_query = f'(1 - (node_memory_MemAvailable_bytes{{instance=~"{node_ip}:.*"}} / node_memory_MemTotal_bytes{{instance=~"{node_ip}:.*"}})) * 100'
-                ram_result = prom.custom_query(ram_query)
-                if ram_result:
-                    ram_usage = float(ram_result[0]["value"][1])
-            except Exception as e:
-                logger.debug(f"RAM query failed for {node_name}: {e}")
-
-            try:
-                # Disk usage for root filesystem
-                disk_query = f'(1 - (node_filesystem_avail_bytes{{instance=~"{node_ip}:.*", mountpoint="/", fstype!="tmpfs"}} / node_filesystem_size_bytes{{instance=~"{node_ip}:.*", mountpoint="/", fstype!="tmpfs"}})) * 100'
-                disk_result = prom.custom_query(disk_query)
-                if disk_result:
-                    disk_usage = float(disk_result[0]["value"][1])
-            except Exception as e:
-                logger.debug(f"Disk query failed for {node_name}: {e}")
-
         # Determine health status
-        has_metrics = cpu_usage is not None or ram_usage is not None
         if status == "NotReady":
             health = "error"
-        elif not has_metrics:
+        elif cpu is None and ram is None:
             health = "unknown"  # No metrics data available
-        elif (cpu_usage is not None and cpu_usage >= 80) or (ram_usage is not None and ram_usage >= 85):
+        elif (cpu is not None and cpu >= CPU_WARN) or (ram is not None and ram >= RAM_WARN):
             health = "warning"
         else:
             health = "healthy"
@@ -291,28 +573,31 @@ async def get_node_metrics() -> List[Dict[str, Any]]:
             "name": node_name,
             "ip": node_ip,
             "status": status,
-            "cpu": round(cpu_usage, 1) if cpu_usage is not None else None,
-            "ram": round(ram_usage, 1) if ram_usage is not None else None,
-            "disk": round(disk_usage, 1) if disk_usage is not None else None,
+            "cpu": round(cpu, 1) if cpu is not None else None,
+            "ram": round(ram, 1) if ram is not None else None,
+            "disk": round(disk, 1) if disk is not None else None,
             "health": health,
         })
 
     return nodes
 
 
+@ttl_cache(3)
 async def get_active_alerts() -> List[Dict[str, Any]]:
     """
     Get firing alerts from Prometheus.
 
     Query: ALERTS{alertstate="firing"}
     """
-    if not config.prometheus.enabled or not prom:
+    if not config.prometheus.enabled:
         return []
 
     alerts = []
 
     try:
-        result = prom.custom_query('ALERTS{alertstate="firing"}')
+        result = await prom_query('ALERTS{alertstate="firing"}')
+        # Every alert in this poll shares one timestamp
+        now_iso = datetime.now(timezone.utc).isoformat()
 
         for item in result:
             metric = item.get("metric", {})
@@ -330,7 +615,7 @@ async def get_active_alerts() -> List[Dict[str, Any]]:
                 "instance": instance,
                 "description": description,
                 "category": categorize_alert(alertname),
-                "time": datetime.now(timezone.utc).isoformat(),
+                "time": now_iso,
             })
     except Exception as e:
         logger.warning(f"Failed to get alerts from Prometheus: {e}")
@@ -338,11 +623,16 @@ async def get_active_alerts() -> List[Dict[str, Any]]:
     return alerts
 
 
+# Statuses meaning the server doesn't implement HEAD, so retry with GET
+_HEAD_UNSUPPORTED = frozenset({405, 501})
+
+
+@ttl_cache(3)
 async def get_service_status() -> Dict[str, Any]:
     """
     Health check all configured services.
 
-    - HTTP GET with 5s timeout
+    - HTTP HEAD (GET if HEAD is unsupported) with 5s timeout, over the shared HTTP_SESSION
     - status: "up" if response <400, "degraded" if 4xx/5xx, "down" if timeout/error
     """
     services = []
@@ -356,40 +646,44 @@ async def get_service_status() -> Dict[str, Any]:
             "totalCount": 0,
         }
 
-    async def check_service(service_config) -> Dict[str, Any]:
-        name = service_config.name
-        url = service_config.url
-        host = service_config.host
-        health_path = service_config.health_path or ""
+    async def check_service(service_config: ServiceConfig) -> Dict[str, Any]:
         status = "down"
         response_time = None
 
-        # Construct full URL with optional health path
-        check_url = url.rstrip("/") + health_path if health_path else url
-
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            headers = {"Host": host} if host else {}
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            start = datetime.now()
+            # Probe with HEAD so the body is never transferred; fall back to
+            # GET for servers that don't implement it. Don't follow
+            # redirects - a 3xx response means the service is up
+            async with HTTP_SESSION.head(
+                service_config.check_url,
+                headers=service_config.headers,
+                allow_redirects=False,
+            ) as response:
+                code = response.status
+            if code in _HEAD_UNSUPPORTED:
                 start = datetime.now()
-                # Don't follow redirects - a 3xx response means the service is up
-                async with session.get(check_url, ssl=False, headers=headers, allow_redirects=False) as response:
-                    response_time = (datetime.now() - start).total_seconds() * 1000
-                    if response.status < 400:
-                        status = "up"
-                    else:
-                        status = "degraded"
+                async with HTTP_SESSION.get(
+                    service_config.check_url,
+                    headers=service_config.headers,
+                    allow_redirects=False,
+                ) as response:
+                    code = response.status
+            response_time = (datetime.now() - start).total_seconds() * 1000
+            if code < 400:
+                status = "up"
+            else:
+                status = "degraded"
         except asyncio.TimeoutError:
             status = "down"
         except Exception as e:
-            logger.debug(f"Service check failed for {name}: {e}")
+            logger.debug("Service check failed for %s: %s", service_config.name, e)
             status = "down"
 
         # Return the friendly URL (with host) for display
-        display_url = f"http://{host}" if host else url
         return {
-            "name": name,
-            "url": display_url,
+            "name": service_config.name,
+            "url": service_config.display_url,
             "status": status,
             "responseTime": round(response_time, 1) if response_time else None,
         }
@@ -415,9 +709,9 @@ async def get_service_status() -> Dict[str, Any]:
 
 async def get_cluster_overview() -> Dict[str, Any]:
     """
-    Get K8s cluster state.
+    Get K8s cluster state from the watch caches.
 
-    - List all pods, count by phase (Running/Pending/Failed)
+    - Count pods by phase (Running/Pending/Failed)
     - Count namespaces
     - Node count and ready count
     """
@@ -428,102 +722,116 @@ async def get_cluster_overview() -> Dict[str, Any]:
         "nodesReady": 0,
     }
 
-    if not config.kubernetes.enabled or not k8s_core_v1:
+    if not K8S_WATCHERS:
         return overview
 
-    try:
-        # Get pods
-        pods = k8s_core_v1.list_pod_for_all_namespaces()
-        for pod in pods.items:
-            phase = pod.status.phase
-            overview["pods"]["total"] += 1
-            if phase == "Running":
-                overview["pods"]["running"] += 1
-            elif phase == "Pending":
-                overview["pods"]["pending"] += 1
-            elif phase in ("Failed", "Unknown"):
-                overview["pods"]["failed"] += 1
-    except Exception as e:
-        logger.warning(f"Failed to get pods: {e}")
+    pods = overview["pods"]
+    for phase in K8S_WATCHERS["pods"].values():
+        pods["total"] += 1
+        if phase == "Running":
+            pods["running"] += 1
+        elif phase == "Pending":
+            pods["pending"] += 1
+        elif phase in ("Failed", "Unknown"):
+            pods["failed"] += 1
 
-    try:
-        # Get namespaces
-        namespaces = k8s_core_v1.list_namespace()
-        overview["namespaces"] = len(namespaces.items)
-    except Exception as e:
-        logger.warning(f"Failed to get namespaces: {e}")
+    overview["namespaces"] = len(K8S_WATCHERS["namespaces"])
 
-    try:
-        # Get nodes
-        nodes = k8s_core_v1.list_node()
-        overview["nodes"] = len(nodes.items)
-        for node in nodes.items:
-            for condition in node.status.conditions or []:
-                if condition.type == "Ready" and condition.status == "True":
-                    overview["nodesReady"] += 1
-                    break
-    except Exception as e:
-        logger.warning(f"Failed to get nodes: {e}")
+    nodes = K8S_WATCHERS["nodes"].values()
+    overview["nodes"] = len(nodes)
+    overview["nodesReady"] = sum(1 for _, ready in nodes if ready)
 
     return overview
 
 
 async def get_recent_activity() -> List[Dict[str, Any]]:
     """
-    Get recent K8s events.
+    Get recent K8s events from the event watch cache (newest first).
 
-    - List events (limit 20)
+    - Take the 10 most recent events
     - Format time as relative (5m, 2h, 1d)
     - Extract: time, message (truncated to 80 chars), type, source
     """
-    if not config.kubernetes.enabled or not k8s_core_v1:
+    if "events" not in K8S_WATCHERS:
         return []
 
-    activities = []
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "time": format_time_ago_from(now, event["timestamp"]) if event["timestamp"] else "unknown",
+            "message": event["message"],
+            "type": event["type"],
+            "source": event["source"],
+            "namespace": event["namespace"],
+            "reason": event["reason"],
+        }
+        for event in K8S_WATCHERS["events"].values()[:10]
+    ]
 
-    try:
-        events = k8s_core_v1.list_event_for_all_namespaces(limit=20)
-        now = datetime.now(timezone.utc)
 
-        # Sort by last timestamp descending
-        sorted_events = sorted(
-            events.items,
-            key=lambda e: e.last_timestamp or e.event_time or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True,
-        )
+def _interface_rates(
+    names: List[str], rx_bytes: List[int], tx_bytes: List[int], time_delta_seconds: float
+) -> Tuple[List[float], List[float]]:
+    """
+    Compute per-interface rx/tx rates (Mbps) against the previous poll's counters.
 
-        for event in sorted_events[:10]:
-            event_time = event.last_timestamp or event.event_time
-            if event_time:
-                if event_time.tzinfo is None:
-                    event_time = event_time.replace(tzinfo=timezone.utc)
-                delta = now - event_time
-                time_ago = format_time_ago(delta)
-            else:
-                time_ago = "unknown"
-
-            message = event.message or ""
-            if len(message) > 80:
-                message = message[:77] + "..."
-
-            source_component = ""
-            if event.source and event.source.component:
-                source_component = event.source.component
-
-            activities.append({
-                "time": time_ago,
-                "message": message,
-                "type": event.type or "Normal",
-                "source": source_component,
-                "namespace": event.metadata.namespace,
-                "reason": event.reason,
-            })
-    except Exception as e:
-        logger.warning(f"Failed to get events: {e}")
+    Works on the parallel counter arrays in one pass per direction, then stores
+    the current counters for the next poll. Interfaces seen for the first time
+    and counters that went backwards (wrap or reset) report 0.
+    """
+    indices = []
+    for name, rx, tx in zip(names, rx_bytes, tx_bytes):
+        idx = _iface_index.get(name)
+        if idx is None:
+            idx = _iface_index[name] = len(_prev_rx_bytes)
+            _prev_rx_bytes.append(rx)
+            _prev_tx_bytes.append(tx)
+        indices.append(idx)
+
+    scale = 8 / (time_delta_seconds * 1_000_000)  # bytes -> Mbps
+    rx_rates = [max(rx - _prev_rx_bytes[i], 0) * scale for i, rx in zip(indices, rx_bytes)]
+    tx_rates = [max(tx - _prev_tx_bytes[i], 0) * scale for i, tx in zip(indices, tx_bytes)]
+
+    # Store current values for next calculation
+    for i, rx, tx in zip(indices, rx_bytes, tx_bytes):
+        _prev_rx_bytes[i] = rx
+        _prev_tx_bytes[i] = tx
+
+    return rx_rates, tx_rates
+
+
+# FortiGate monitor API endpoints read by get_network_status, in unpack order
+FORTIGATE_ENDPOINTS = (
+    "/api/v2/monitor/system/status",
+    "/api/v2/monitor/system/resource/usage",
+    "/api/v2/monitor/system/performance/status",
+    "/api/v2/monitor/system/interface",
+    "/api/v2/monitor/system/dhcp",
+    "/api/v2/monitor/network/arp",
+)
 
-    return activities
+# Interfaces shown on the dashboard: every one of these types, plus the
+# well-known ports whatever their type
+_PHYS_TYPES: FrozenSet[str] = frozenset({"physical", "vlan", "aggregate"})
+_ALWAYS_IFACES: FrozenSet[str] = frozenset({"wan1", "wan2", "lan", "internal"})
 
 
+async def _fortigate_get(session: aiohttp.ClientSession, path: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """GET a FortiGate API endpoint; returns the parsed JSON, or None if not 200."""
+    async with session.get(f"{config.firewall.host}{path}", headers=headers) as resp:
+        if resp.status == 200:
+            return orjson.loads(await resp.read())
+        return None
+
+
+def _fortigate_result(result: Any) -> Optional[Dict[str, Any]]:
+    """Unwrap a gathered _fortigate_get result, re-raising a failed fetch."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+@ttl_cache(5)
 async def get_network_status() -> Dict[str, Any]:
     """
     Get network topology and status from Fortigate API.
@@ -534,7 +842,7 @@ async def get_network_status() -> Dict[str, Any]:
     - DHCP leases: active lease count
     - ARP table: device count on network
     """
-    global _previous_interface_stats, _last_interface_poll
+    global _last_interface_poll
 
     network = {
         "firewall": {
@@ -557,12 +865,12 @@ async def get_network_status() -> Dict[str, Any]:
         return network
 
     if not FORTIGATE_API_KEY:
-        logger.debug(f"Firewall API key not found in {config.firewall.token_env_var}")
+        logger.debug("Firewall API key not found in %s", config.firewall.token_env_var)
         return network
 
     # Currently only FortiGate is supported
     if config.firewall.type != "fortigate":
-        logger.debug(f"Firewall type '{config.firewall.type}' not yet supported")
+        logger.debug("Firewall type '%s' not yet supported", config.firewall.type)
         return network
 
     headers = {
@@ -571,171 +879,138 @@ async def get_network_status() -> Dict[str, Any]:
     }
 
     now = datetime.now(timezone.utc)
-    fortigate_url = config.firewall.host
 
     try:
-        timeout = aiohttp.ClientTimeout(total=10)
-        connector = aiohttp.TCPConnector(ssl=config.firewall.verify_ssl)
+        # The endpoints are independent, so fetch them all concurrently
+        (
+            status_result,
+            resource_result,
+            performance_result,
+            interface_result,
+            dhcp_result,
+            arp_result,
+        ) = await asyncio.gather(
+            *(_fortigate_get(FIREWALL_SESSION, path, headers) for path in FORTIGATE_ENDPOINTS),
+            return_exceptions=True,
+        )
 
-        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
-            # Get system status (hostname, model, version)
-            try:
-                async with session.get(
-                    f"{fortigate_url}/api/v2/monitor/system/status",
-                    headers=headers,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        results = data.get("results", {})
-                        network["firewall"]["hostname"] = results.get("hostname", "Unknown")
-                        model_name = results.get("model_name", "FortiGate")
-                        model_number = results.get("model_number", "")
-                        network["firewall"]["model"] = f"{model_name}-{model_number}" if model_number else model_name
-                        # Version is in top-level response, not results
-                        network["firewall"]["firmware"] = data.get("version", "Unknown")
-                        network["firewall"]["status"] = "online"
-                        network["available"] = True
-                        logger.debug(f"Fortigate status: hostname={network['firewall']['hostname']}, model={network['firewall']['model']}, firmware={network['firewall']['firmware']}")
-            except Exception as e:
-                logger.debug(f"Fortigate system status failed: {e}")
+        # Get system status (hostname, model, version)
+        try:
+            data = _fortigate_result(status_result)
+            if data is not None:
+                results = data.get("results", {})
+                network["firewall"]["hostname"] = results.get("hostname", "Unknown")
+                model_name = results.get("model_name", "FortiGate")
+                model_number = results.get("model_number", "")
+                network["firewall"]["model"] = f"{model_name}-{model_number}" if model_number else model_name
+                # Version is in top-level response, not results
+                network["firewall"]["firmware"] = data.get("version", "Unknown")
+                network["firewall"]["status"] = "online"
+                network["available"] = True
+                logger.debug("Fortigate status: hostname=%s, model=%s, firmware=%s", network["firewall"]["hostname"], network["firewall"]["model"], network["firewall"]["firmware"])
+        except Exception as e:
+            logger.debug("Fortigate system status failed: %s", e)
 
-            # Get CPU/memory from resource/usage endpoint (FortiOS 7.x)
-            try:
-                async with session.get(
-                    f"{fortigate_url}/api/v2/monitor/system/resource/usage",
-                    headers=headers,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        results = data.get("results", {})
-                        # CPU is in results.cpu[0].current
-                        cpu_data = results.get("cpu", [])
-                        if isinstance(cpu_data, list) and len(cpu_data) > 0:
-                            network["firewall"]["cpu"] = round(cpu_data[0].get("current", 0), 1)
-                        # Memory is in results.mem[0].current
-                        mem_data = results.get("mem", [])
-                        if isinstance(mem_data, list) and len(mem_data) > 0:
-                            network["firewall"]["memory"] = round(mem_data[0].get("current", 0), 1)
-                        logger.debug(f"Fortigate resource/usage: cpu={network['firewall']['cpu']}, mem={network['firewall']['memory']}")
-            except Exception as e:
-                logger.debug(f"Fortigate resource/usage failed: {e}")
+        # Get CPU/memory from resource/usage endpoint (FortiOS 7.x)
+        try:
+            data = _fortigate_result(resource_result)
+            if data is not None:
+                results = data.get("results", {})
+                # CPU is in results.cpu[0].current
+                cpu_data = results.get("cpu", [])
+                if isinstance(cpu_data, list) and len(cpu_data) > 0:
+                    network["firewall"]["cpu"] = round(cpu_data[0].get("current", 0), 1)
+                # Memory is in results.mem[0].current
+                mem_data = results.get("mem", [])
+                if isinstance(mem_data, list) and len(mem_data) > 0:
+                    network["firewall"]["memory"] = round(mem_data[0].get("current", 0), 1)
+                logger.debug("Fortigate resource/usage: cpu=%s, mem=%s", network["firewall"]["cpu"], network["firewall"]["memory"])
+        except Exception as e:
+            logger.debug("Fortigate resource/usage failed: %s", e)
 
-            # Get uptime from performance/status endpoint (fallback for older firmware)
-            try:
-                async with session.get(
-                    f"{fortigate_url}/api/v2/monitor/system/performance/status",
-                    headers=headers,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        results = data.get("results", {})
-                        # Uptime in seconds
-                        uptime_seconds = results.get("uptime", 0)
-                        if uptime_seconds > 0:
-                            network["firewall"]["uptime"] = uptime_seconds
-                            network["firewall"]["uptimeFormatted"] = format_uptime(uptime_seconds)
-                        logger.debug(f"Fortigate performance/status: uptime={uptime_seconds}")
-            except Exception as e:
-                logger.debug(f"Fortigate performance/status failed: {e}")
+        # Get uptime from performance/status endpoint (fallback for older firmware)
+        try:
+            data = _fortigate_result(performance_result)
+            if data is not None:
+                results = data.get("results", {})
+                # Uptime in seconds
+                uptime_seconds = results.get("uptime", 0)
+                if uptime_seconds > 0:
+                    network["firewall"]["uptime"] = uptime_seconds
+                    network["firewall"]["uptimeFormatted"] = format_uptime(uptime_seconds)
+                logger.debug("Fortigate performance/status: uptime=%s", uptime_seconds)
+        except Exception as e:
+            logger.debug("Fortigate performance/status failed: %s", e)
 
-            # Get interfaces with bandwidth calculation
-            try:
-                async with session.get(
-                    f"{fortigate_url}/api/v2/monitor/system/interface",
-                    headers=headers,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        results = data.get("results", {})
-
-                        # Calculate time delta for bandwidth rate
-                        time_delta_seconds = 5.0  # default
-                        if _last_interface_poll:
-                            time_delta_seconds = max((now - _last_interface_poll).total_seconds(), 1.0)
-
-                        for iface_name, iface_data in results.items():
-                            # Only include physical and important interfaces
-                            if iface_data.get("type") in ("physical", "vlan", "aggregate") or iface_name in ("wan1", "wan2", "lan", "internal"):
-                                # Get IP address
-                                ip_addr = ""
-                                if iface_data.get("ip"):
-                                    ip_addr = iface_data["ip"]
-                                elif isinstance(iface_data.get("ipv4"), list) and iface_data["ipv4"]:
-                                    ip_addr = iface_data["ipv4"][0].get("ip", "")
-
-                                rx_bytes = iface_data.get("rx_bytes", 0)
-                                tx_bytes = iface_data.get("tx_bytes", 0)
-
-                                # Calculate bandwidth rate (Mbps)
-                                rx_rate = 0.0
-                                tx_rate = 0.0
-                                if iface_name in _previous_interface_stats and time_delta_seconds > 0:
-                                    prev = _previous_interface_stats[iface_name]
-                                    rx_delta = rx_bytes - prev.get("rx_bytes", rx_bytes)
-                                    tx_delta = tx_bytes - prev.get("tx_bytes", tx_bytes)
-                                    # Handle counter wrap or reset
-                                    if rx_delta >= 0:
-                                        rx_rate = (rx_delta * 8) / (time_delta_seconds * 1_000_000)  # Mbps
-                                    if tx_delta >= 0:
-                                        tx_rate = (tx_delta * 8) / (time_delta_seconds * 1_000_000)  # Mbps
-
-                                # Store current values for next calculation
-                                _previous_interface_stats[iface_name] = {
-                                    "rx_bytes": rx_bytes,
-                                    "tx_bytes": tx_bytes,
-                                }
-
-                                network["interfaces"].append({
-                                    "name": iface_name,
-                                    "ip": ip_addr,
-                                    "status": "up" if iface_data.get("link") else "down",
-                                    "speed": iface_data.get("speed", 0),
-                                    "rxBytes": rx_bytes,
-                                    "txBytes": tx_bytes,
-                                    "rxRate": round(rx_rate, 2),  # Mbps
-                                    "txRate": round(tx_rate, 2),  # Mbps
-                                })
-
-                        _last_interface_poll = now
-            except Exception as e:
-                logger.debug(f"Fortigate interface status failed: {e}")
+        # Get interfaces with bandwidth calculation
+        try:
+            data = _fortigate_result(interface_result)
+            if data is not None:
+                results = data.get("results", {})
+
+                # Calculate time delta for bandwidth rate
+                time_delta_seconds = 5.0  # default
+                if _last_interface_poll:
+                    time_delta_seconds = max((now - _last_interface_poll).total_seconds(), 1.0)
+
+                # Only include physical and important interfaces
+                selected = [
+                    (iface_name, iface_data)
+                    for iface_name, iface_data in results.items()
+                    if iface_data.get("type") in _PHYS_TYPES or iface_name in _ALWAYS_IFACES
+                ]
+                names = [iface_name for iface_name, _ in selected]
+                rx_bytes = [iface_data.get("rx_bytes", 0) for _, iface_data in selected]
+                tx_bytes = [iface_data.get("tx_bytes", 0) for _, iface_data in selected]
+                rx_rates, tx_rates = _interface_rates(names, rx_bytes, tx_bytes, time_delta_seconds)
+
+                for (iface_name, iface_data), rx, tx, rx_rate, tx_rate in zip(selected, rx_bytes, tx_bytes, rx_rates, tx_rates):
+                    # Get IP address
+                    ip_addr = ""
+                    if iface_data.get("ip"):
+                        ip_addr = iface_data["ip"]
+                    elif isinstance(iface_data.get("ipv4"), list) and iface_data["ipv4"]:
+                        ip_addr = iface_data["ipv4"][0].get("ip", "")
+
+                    network["interfaces"].append({
+                        "name": iface_name,
+                        "ip": ip_addr,
+                        "status": "up" if iface_data.get("link") else "down",
+                        "speed": iface_data.get("speed", 0),
+                        "rxBytes": rx,
+                        "txBytes": tx,
+                        "rxRate": round(rx_rate, 2),  # Mbps
+                        "txRate": round(tx_rate, 2),  # Mbps
+                    })
+
+                _last_interface_poll = now
+        except Exception as e:
+            logger.debug("Fortigate interface status failed: %s", e)
 
-            # Get DHCP leases count
-            try:
-                async with session.get(
-                    f"{fortigate_url}/api/v2/monitor/system/dhcp",
-                    headers=headers,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        results = data.get("results", [])
-                        # FortiOS 7.x returns flat list of leases
-                        if isinstance(results, list):
-                            # Count items that have 'ip' and 'mac' (actual leases)
-                            lease_count = sum(1 for item in results if isinstance(item, dict) and item.get("ip") and item.get("mac"))
-                            network["dhcpLeases"] = lease_count
-                            logger.debug(f"DHCP leases: {lease_count}")
-            except Exception as e:
-                logger.debug(f"Fortigate DHCP status failed: {e}")
+        # Get DHCP leases count
+        try:
+            data = _fortigate_result(dhcp_result)
+            if data is not None:
+                results = data.get("results", [])
+                # FortiOS 7.x returns flat list of leases
+                if isinstance(results, list):
+                    # Count items that have 'ip' and 'mac' (actual leases)
+                    lease_count = sum(1 for item in results if isinstance(item, dict) and item.get("ip") and item.get("mac"))
+                    network["dhcpLeases"] = lease_count
+                    logger.debug("DHCP leases: %d", lease_count)
+        except Exception as e:
+            logger.debug("Fortigate DHCP status failed: %s", e)
 
-            # Get ARP table for device count
-            try:
-                async with session.get(
-                    f"{fortigate_url}/api/v2/monitor/network/arp",
-                    headers=headers,
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        results = data.get("results", [])
-                        # Count unique MAC addresses (excluding incomplete entries)
-                        macs = set()
-                        for entry in results:
-                            mac = entry.get("mac", "")
-                            if mac and mac != "00:00:00:00:00:00":
-                                macs.add(mac)
-                        network["deviceCount"] = len(macs)
-            except Exception as e:
-                logger.debug(f"Fortigate ARP table failed: {e}")
+        # Get ARP table for device count
+        try:
+            data = _fortigate_result(arp_result)
+            if data is not None:
+                results = data.get("results", [])
+                # Count unique MAC addresses (excluding incomplete entries)
+                macs = {mac for entry in results if (mac := entry.get("mac")) and mac != "00:00:00:00:00:00"}
+                network["deviceCount"] = len(macs)
+        except Exception as e:
+            logger.debug("Fortigate ARP table failed: %s", e)
 
     except Exception as e:
         logger.warning(f"Fortigate API connection failed: {e}")
@@ -754,16 +1029,17 @@ async def health_check():
     prometheus_ok = False
     kubernetes_ok = False
 
-    if config.prometheus.enabled and prom:
+    if config.prometheus.enabled:
         try:
-            prom.custom_query("up")
+            await prom_query("up")
             prometheus_ok = True
         except Exception:
             pass
 
-    if config.kubernetes.enabled and k8s_core_v1:
+    k8s_core_v1 = get_k8s_core()
+    if k8s_core_v1:
         try:
-            k8s_core_v1.list_namespace(limit=1)
+            k8s_core_v1.list_namespace(limit=1, resource_version="0")
             kubernetes_ok = True
         except Exception:
             pass
@@ -779,6 +1055,22 @@ async def health_check():
     }
 
 
+# The public config only depends on the loaded config, so it is encoded once
+_PUBLIC_CONFIG_BYTES = orjson.dumps({
+    "dashboard": {
+        "title": config.dashboard.title,
+        "version": config.dashboard.version,
+        "tagline": config.dashboard.tagline,
+    },
+    "features": {
+        "prometheus": config.prometheus.enabled,
+        "kubernetes": config.kubernetes.enabled,
+        "firewall": config.firewall.enabled,
+        "firewallType": config.firewall.type if config.firewall.enabled else None,
+    }
+})
+
+
 @app.get("/api/config")
 async def get_public_config():
     """
@@ -787,19 +1079,7 @@ async def get_public_config():
     Returns dashboard settings and enabled features.
     Does NOT expose sensitive information like API tokens or internal URLs.
     """
-    return {
-        "dashboard": {
-            "title": config.dashboard.title,
-            "version": config.dashboard.version,
-            "tagline": config.dashboard.tagline,
-        },
-        "features": {
-            "prometheus": config.prometheus.enabled,
-            "kubernetes": config.kubernetes.enabled,
-            "firewall": config.firewall.enabled,
-            "firewallType": config.firewall.type if config.firewall.enabled else None,
-        }
-    }
+    return Response(_PUBLIC_CONFIG_BYTES, media_type="application/json")
 
 
 @app.get("/api/nodes")
@@ -820,16 +1100,41 @@ async def get_alerts():
 async def get_services():
     """Get service status."""
     status = await get_service_status()
-    status["timestamp"] = datetime.now(timezone.utc).isoformat()
-    return status
+    return {**status, "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
 @app.get("/api/network")
 async def get_network():
     """Get network topology and status from Fortigate."""
     network = await get_network_status()
-    network["timestamp"] = datetime.now(timezone.utc).isoformat()
-    return network
+    return {**network, "timestamp": datetime.now(timezone.utc).isoformat()}
+
+
+# Placeholders for disabled features, shared across ticks (only ever encoded,
+# never mutated)
+_EMPTY_ALERTS: Dict[str, Any] = {"items": [], "count": 0}
+_EMPTY_CLUSTER: Dict[str, Any] = {
+    "pods": {"running": 0, "pending": 0, "failed": 0, "total": 0},
+    "namespaces": 0,
+    "nodes": 0,
+    "nodesReady": 0,
+}
+_EMPTY_NETWORK: Dict[str, Any] = {
+    "firewall": {
+        "hostname": "Unknown",
+        "model": "Unknown",
+        "firmware": "Unknown",
+        "uptime": 0,
+        "uptimeFormatted": "Unknown",
+        "cpu": 0,
+        "memory": 0,
+        "status": "unknown",
+    },
+    "interfaces": [],
+    "dhcpLeases": 0,
+    "deviceCount": 0,
+    "available": False,
+}
 
 
 @app.get("/api/dashboard")
@@ -839,124 +1144,120 @@ async def get_dashboard():
 
     Only includes data for enabled features.
     """
-    # Build list of tasks based on enabled features
-    tasks = [get_service_status()]  # Always fetch services
+    # Build the tasks for enabled features, keyed by result name
+    tasks: Dict[str, Any] = {"services": get_service_status()}  # Always fetch services
 
     if config.prometheus.enabled:
-        tasks.extend([get_node_metrics(), get_active_alerts()])
+        tasks["nodes"] = get_node_metrics()
+        tasks["alerts"] = get_active_alerts()
 
     if config.kubernetes.enabled:
-        tasks.extend([get_cluster_overview(), get_recent_activity()])
+        tasks["cluster"] = get_cluster_overview()
+        tasks["activity"] = get_recent_activity()
 
     if config.firewall.enabled:
-        tasks.append(get_network_status())
+        tasks["network"] = get_network_status()
 
     # Gather all data concurrently
-    results = await asyncio.gather(*tasks)
-
-    # Build response based on what was fetched
-    result_idx = 0
+    keys, coros = zip(*tasks.items())
+    results = dict(zip(keys, await asyncio.gather(*coros)))
 
-    # Services (always present)
-    services = results[result_idx]
-    result_idx += 1
-
-    data: Dict[str, Any] = {
+    alerts = results.get("alerts")
+    return {
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "services": services,
+        "services": results["services"],
+        "infrastructure": {
+            "nodes": results.get("nodes", []),
+            "cluster": results.get("cluster", _EMPTY_CLUSTER),
+        },
+        "alerts": {"items": alerts, "count": len(alerts)} if alerts is not None else _EMPTY_ALERTS,
+        "activity": results.get("activity", []),
+        "network": results.get("network", _EMPTY_NETWORK),
     }
 
-    # Infrastructure (Prometheus nodes + K8s cluster)
-    if config.prometheus.enabled or config.kubernetes.enabled:
-        data["infrastructure"] = {}
-
-        if config.prometheus.enabled:
-            data["infrastructure"]["nodes"] = results[result_idx]
-            result_idx += 1
-            data["alerts"] = {
-                "items": results[result_idx],
-                "count": len(results[result_idx]),
-            }
-            result_idx += 1
-        else:
-            data["infrastructure"]["nodes"] = []
-            data["alerts"] = {"items": [], "count": 0}
-
-        if config.kubernetes.enabled:
-            data["infrastructure"]["cluster"] = results[result_idx]
-            result_idx += 1
-            data["activity"] = results[result_idx]
-            result_idx += 1
-        else:
-            data["infrastructure"]["cluster"] = {
-                "pods": {"running": 0, "pending": 0, "failed": 0, "total": 0},
-                "namespaces": 0,
-                "nodes": 0,
-                "nodesReady": 0,
-            }
-            data["activity"] = []
-    else:
-        # No infrastructure features enabled - provide empty defaults
-        data["infrastructure"] = {
-            "nodes": [],
-            "cluster": {
-                "pods": {"running": 0, "pending": 0, "failed": 0, "total": 0},
-                "namespaces": 0,
-                "nodes": 0,
-                "nodesReady": 0,
-            }
-        }
-        data["alerts"] = {"items": [], "count": 0}
-        data["activity"] = []
-
-    # Network (Firewall)
-    if config.firewall.enabled:
-        data["network"] = results[result_idx]
-        result_idx += 1
-    else:
-        data["network"] = {
-            "firewall": {
-                "hostname": "Unknown",
-                "model": "Unknown",
-                "firmware": "Unknown",
-                "uptime": 0,
-                "uptimeFormatted": "Unknown",
-                "cpu": 0,
-                "memory": 0,
-                "status": "unknown",
-            },
-            "interfaces": [],
-            "dhcpLeases": 0,
-            "deviceCount": 0,
-            "available": False,
-        }
-
-    return data
-
 
 # =============================================================================
 # WebSocket Endpoint
 # =============================================================================
 
+DASHBOARD_INTERVAL = 5  # seconds between dashboard pushes
+
+# Most recent encoded dashboard payload as (monotonic time computed, JSON text)
+_latest_dashboard: Optional[Tuple[float, str]] = None
+_dashboard_ticker: Optional[asyncio.Task] = None
+# Set to make the ticker compute the next frame now rather than at the next tick
+_dashboard_wakeup: Optional[asyncio.Event] = None
+
+
+async def dashboard_ticker():
+    """
+    Compute the dashboard once per interval and broadcast it to all clients.
+
+    Upstream load is independent of the number of connected clients, and
+    nothing is fetched while no one is connected. Frames are computed and
+    sent one at a time, so every client receives them in order.
+    """
+    global _latest_dashboard
+
+    while True:
+        if manager.active_connections:
+            try:
+                # Encode once per tick; the same text goes to every client
+                # and to clients connecting before the next tick
+                payload = orjson.dumps(await get_dashboard()).decode()
+                # Clients that joined while this frame was computed get it too,
+                # so their wakeups are already served
+                _dashboard_wakeup.clear()
+                _latest_dashboard = (time.monotonic(), payload)
+                await manager.broadcast_text(payload)
+            except Exception as e:
+                logger.error(f"Dashboard broadcast failed: {e}")
+
+        try:
+            await asyncio.wait_for(_dashboard_wakeup.wait(), DASHBOARD_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+@app.on_event("startup")
+async def start_dashboard_ticker():
+    global _dashboard_ticker, _dashboard_wakeup
+    _dashboard_wakeup = asyncio.Event()
+    _dashboard_ticker = asyncio.create_task(dashboard_ticker())
+
+
+@app.on_event("shutdown")
+async def stop_dashboard_ticker():
+    if _dashboard_ticker:
+        _dashboard_ticker.cancel()
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time dashboard updates."""
-    await manager.connect(websocket)
+    await websocket.accept()
 
     try:
-        while True:
-            # Gather all dashboard data
-            data = await get_dashboard()
-
-            # Send to client
-            await websocket.send_json(data)
-
-            # Wait 5 seconds before next update
-            await asyncio.sleep(5)
+        if _latest_dashboard and time.monotonic() - _latest_dashboard[0] < DASHBOARD_INTERVAL:
+            # Send the latest frame before joining the broadcast set, so no
+            # ticker frame can reach the client ahead of it
+            await websocket.send_text(_latest_dashboard[1])
+            manager.connect(websocket)
+        else:
+            # Stale: join and have the ticker compute a frame now. Every frame
+            # this client sees then comes from the ticker, in order, and a
+            # client leaving during the wait is just dropped by the broadcast.
+            manager.connect(websocket)
+            _dashboard_wakeup.set()
+
+        # Clients don't send anything, so just wait for the disconnect
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
         manager.disconnect(websocket)
 
 
@@ -964,21 +1265,56 @@ async def websocket_endpoint(websocket: WebSocket):
 # Static File Serving (for unified Docker image)
 # =============================================================================
 
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles variant that serves files from memory with long-lived caching.
+
+    Files are read once at startup. The Vite build emits content-hashed asset
+    names, so responses are marked immutable and browsers never revalidate
+    them. Paths not found in memory fall back to the regular StaticFiles lookup.
+    """
+
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def __init__(self, *, directory: str, **kwargs):
+        super().__init__(directory=directory, **kwargs)
+        self._files: Dict[str, Tuple[bytes, str]] = {}
+        for root, _, filenames in os.walk(directory):
+            for filename in filenames:
+                full_path = os.path.join(root, filename)
+                rel_path = os.path.normpath(os.path.relpath(full_path, directory))
+                media_type = mimetypes.guess_type(filename)[0] or "text/plain"
+                with open(full_path, "rb") as f:
+                    self._files[rel_path] = (f.read(), media_type)
+
+    async def get_response(self, path: str, scope) -> Response:
+        cached = self._files.get(path)
+        if cached is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        content, media_type = cached
+        return Response(content, media_type=media_type, headers={"Cache-Control": self.CACHE_CONTROL})
+
+
 # Check if static files exist (built frontend)
 static_dir = Path(__file__).parent / "static"
 if static_dir.exists() and (static_dir / "index.html").exists():
     # Mount assets directory
     if (static_dir / "assets").exists():
-        app.mount("/assets", StaticFiles(directory=str(static_dir / "assets")), name="assets")
+        app.mount("/assets", CachedStaticFiles(directory=str(static_dir / "assets")), name="assets")
+
+    # Serve index.html for all non-API routes (SPA routing). The page only
+    # changes with a new image, so it is read once rather than per request.
+    _API_PREFIXES: Tuple[str, ...] = ("api/", "ws")
+    _INDEX_BYTES = (static_dir / "index.html").read_bytes()
 
-    # Serve index.html for all non-API routes (SPA routing)
     @app.get("/{full_path:path}")
     async def serve_frontend(full_path: str):
         """Serve the frontend SPA for all non-API routes."""
         # Don't serve frontend for API or WebSocket routes
-        if full_path.startswith("api/") or full_path.startswith("ws"):
-            return {"error": "Not found"}
-        return FileResponse(str(static_dir / "index.html"))
+        if full_path.startswith(_API_PREFIXES):
+            raise HTTPException(status_code=404, detail="Not found")
+        return Response(_INDEX_BYTES, media_type="text/html")
 
 
 # =============================================================================
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from main import ttl_cache
+
+
+def make_counted(delay: float, ttl: float, fail: bool = False):
+    calls = []
+
+    @ttl_cache(ttl)
+    async def fetch():
+        calls.append(None)
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("backend down")
+        return len(calls)
+
+    return fetch, calls
+
+
+def test_call_outlasting_ttl_is_not_started_twice():
+    fetch, calls = make_counted(delay=0.3, ttl=0.1)
+
+    async def run():
+        first = asyncio.ensure_future(fetch())
+        await asyncio.sleep(0.2)  # past the TTL, first call still running
+        second = await fetch()
+        return await first, second
+
+    assert asyncio.run(run()) == (1, 1)
+    assert len(calls) == 1
+
+
+def test_ttl_starts_when_call_finishes():
+    fetch, calls = make_counted(delay=0.2, ttl=0.15)
+
+    async def run():
+        await fetch()
+        await asyncio.sleep(0.1)  # 0.3s after the start, 0.1s after the finish
+        cached = await fetch()
+        await asyncio.sleep(0.1)
+        refreshed = await fetch()
+        return cached, refreshed
+
+    assert asyncio.run(run()) == (1, 2)
+    assert len(calls) == 2
+
+
+def test_failures_are_not_cached():
+    fetch, calls = make_counted(delay=0, ttl=10, fail=True)
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await fetch()
+
+    asyncio.run(run())
+    assert len(calls) == 2